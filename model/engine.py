@@ -1,39 +1,163 @@
+import functools
+import multiprocessing
+from collections import namedtuple
+from dataclasses import dataclass
+
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.special import ndtr, ndtri
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional: NumPy reductions are used instead
+    njit = None
 
 
 # ===============================
 # 4. Business engine + Monte Carlo
 # ===============================
 
-def sample_demand(strategy: str, globalParams: dict, params: dict, rng=None):
+# Simulations are processed in chunks of this many paths, so that demand
+# arrays and intermediates stay cache-resident instead of spanning N_Sim.
+MC_CHUNK_SIZE = 16384
+
+# Largest float32 below 1: rescaled uniforms are clamped to it, since a
+# float32 rounding to exactly 1.0 would make ndtri return inf
+_U_MAX_F32 = np.nextafter(np.float32(1.0), np.float32(0.0))
+
+# Reusable sample buffers, keyed by (shape, dtype): see acquire_buffer
+_BUF_POOL: dict = {}
+
+
+def acquire_buffer(shape: tuple, dtype=np.float32) -> np.ndarray:
+    """
+    Returns an uninitialized array of the given shape/dtype, reusing a
+    released one when available instead of allocating a new one.
+    """
+    key = (tuple(shape), np.dtype(dtype))
+    free = _BUF_POOL.get(key)
+    if free:
+        return free.pop()
+    return np.empty(shape, dtype=dtype)
+
+
+def release_buffer(arr: np.ndarray) -> None:
+    """
+    Hands an array obtained from acquire_buffer back to the pool. The caller
+    must not use it afterwards.
+    """
+    _BUF_POOL.setdefault((arr.shape, arr.dtype), []).append(arr)
+
+
+def _sample_paths(rng, mu: float, std: float, out: np.ndarray, dist: str,
+                  u: np.ndarray = None):
+    """
+    Fills the float32 array out in place (no temporaries) with nonnegative
+    demand draws with mean parameter mu and dispersion std:
+      - "clipped":   N(mu, std) with negative draws set to 0
+      - "truncated": N(mu, std) truncated to [0, inf), sampled by inverse CDF
+                     (one uniform draw + one ndtri pass, no rejection)
+    u: optional uniforms in [0, 1) with out's shape (e.g. Sobol points);
+    when given they are mapped by inverse CDF instead of drawing from rng.
+
+    mu = 0 (lo = 0.5) must stay finite at the top of the float32 range:
+
+    >>> u = np.array([[np.nextafter(np.float32(1), np.float32(0))]])
+    >>> bool(np.isfinite(_sample_paths(None, 0.0, 1.0,
+    ...                                np.empty((1, 1), np.float32),
+    ...                                "truncated", u)).all())
+    True
+    """
+    if dist == "clipped":
+        if u is None:
+            rng.standard_normal(out=out, dtype=np.float32)
+        else:
+            ndtri(u, out=out)
+    elif dist == "truncated":
+        if std <= 0:
+            out[...] = max(mu, 0.0)
+            return out
+        lo = ndtr(-mu / std)  # Phi(a), a = lower bound in z-units
+        if u is None:
+            rng.random(out=out, dtype=np.float32)
+            out *= 1.0 - lo
+            out += lo
+        else:
+            # QMC points are float64: rescale before rounding into out
+            out[...] = lo + (1.0 - lo) * u
+        np.minimum(out, _U_MAX_F32, out=out)
+        ndtri(out, out=out)
+    else:
+        raise ValueError(f"Unknown demand distribution: {dist!r}")
+
+    out *= std
+    out += mu
+    # also guards float32 rounding at the truncation point
+    np.maximum(out, 0.0, out=out)
+    return out
+
+
+def make_qmc_engine(globalParams: dict, rng=None):
+    """
+    Returns a scrambled Sobol' engine over the 2*T demand dimensions when
+    globalParams["sampler"] == "sobol", or None for pseudo-random sampling.
+    Sobol' points balance best when N_Sim (and the chunk size) are powers
+    of 2.
+    """
+    sampler = globalParams.get("sampler", "pseudo")
+    if sampler == "pseudo":
+        return None
+    if sampler == "sobol":
+        # scipy.stats is slow to import; only pay for it when Sobol is used
+        from scipy.stats import qmc
+        return qmc.Sobol(d=2 * globalParams["T"], scramble=True, seed=rng)
+    raise ValueError(f"Unknown sampler: {sampler!r}")
+
+
+# Resolved scalars of an operating strategy (RELE / OILTS): prices, total
+# operating cost rate, one-off renovation cost and demand distribution.
+StratConfig = namedtuple(
+    "StratConfig",
+    "price_std price_wkd r_total renovation mu_std mu_wkd sigma_std sigma_wkd",
+)
+
+
+def sample_demand(strategy: str, globalParams: dict, params: dict, rng=None,
+                  n_sim: int = None, qmc_engine=None, cfg: StratConfig = None):
     """
     Generate demand paths (standard student-weeks and weekend students)
-    for a given strategy.
+    for a given strategy, as float32 arrays (n_sim, T).
+    n_sim defaults to globalParams["N_Sim"].
+
+    The arrays come from the buffer pool; callers that are done with them
+    may return them with release_buffer.
+
+    globalParams["demand_dist"] selects how negative demand is avoided:
+    "clipped" (default) or "truncated" (see _sample_paths).
+    qmc_engine: optional quasi-Monte Carlo engine (see make_qmc_engine);
+    its next n_sim points replace the pseudo-random draws from rng.
+    cfg: optional prebuilt StratConfig (see build_strat_config).
     """
     if rng is None:
         rng = np.random.default_rng()
+    if cfg is None:
+        cfg = build_strat_config(strategy, globalParams, params)
 
     T = globalParams["T"]
-    N = globalParams["N_Sim"]
-
-    mean_std = globalParams["stud_std_mean"]
-    std_std  = globalParams["stud_std_std"]
-    mean_wkd = globalParams["stud_wkd_mean"]
-    std_wkd  = globalParams["stud_wkd_std"]
-
-    cfg = params[strategy]
-    mult_std = cfg.get("demand_mult_std", 1.0)
-    mult_wkd = cfg.get("demand_mult_wkd", 1.0)
+    N = globalParams["N_Sim"] if n_sim is None else n_sim
 
-    mu_std = mean_std * mult_std
-    mu_wkd = mean_wkd * mult_wkd
+    dist = globalParams.get("demand_dist", "clipped")
 
-    students_std = rng.normal(loc=mu_std, scale=std_std, size=(N, T))
-    students_wkd = rng.normal(loc=mu_wkd, scale=std_wkd, size=(N, T))
+    u_std = u_wkd = None
+    if qmc_engine is not None:
+        u = qmc_engine.random(N)  # (N, 2T)
+        u_std, u_wkd = u[:, :T], u[:, T:]
 
-    students_std = np.clip(students_std, 0, None)
-    students_wkd = np.clip(students_wkd, 0, None)
+    # float32 halves memory traffic; precision is far beyond what NPV needs
+    students_std = _sample_paths(rng, cfg.mu_std, cfg.sigma_std,
+                                 acquire_buffer((N, T), np.float32), dist, u_std)
+    students_wkd = _sample_paths(rng, cfg.mu_wkd, cfg.sigma_wkd,
+                                 acquire_buffer((N, T), np.float32), dist, u_wkd)
 
     return students_std, students_wkd
 
@@ -49,6 +173,120 @@ def build_debt_schedule(globalParams: dict) -> np.ndarray:
     return debt
 
 
+@functools.lru_cache(maxsize=None)
+def _discount_factors_cached(T: int, k: float) -> np.ndarray:
+    """
+    Discount factors 1 / (1 + k)^t, t = 1..T, as a cumulative product
+    (T - 1 multiplications instead of T powers). Cached per (T, k), so the
+    returned array is read-only.
+    """
+    factors = np.multiply.accumulate(np.full(T, 1.0 / (1.0 + k)))
+    factors.setflags(write=False)
+    return factors
+
+
+def discount_factors(globalParams: dict) -> np.ndarray:
+    """
+    Returns a read-only array (T,) with the discount factors 1 / (1 + K)^t,
+    t = 1..T.
+    """
+    return _discount_factors_cached(globalParams["T"], globalParams["K"])
+
+
+def _renovation_cost(strategy: str, globalParams: dict) -> float:
+    """One-off renovation cost of a strategy (only OILTS has one)."""
+    if strategy == "OILTS":
+        return globalParams.get("OILTS_renovation_cost", 0.0)
+    return 0.0
+
+
+def _resolve_scalars(strategy: str, globalParams: dict, params: dict) -> tuple:
+    """
+    Resolves the economics of a strategy once, with globalParams fallbacks:
+    (price_std, price_wkd, r_total, renovation), where renovation is the
+    one-off OILTS cost (0 for other strategies).
+    """
+    cfg = params[strategy]
+    royalty_rate = cfg.get("royalty_rate", globalParams["royalty_rate_base"])
+    return (
+        cfg.get("price_week",    globalParams["price_std_base"]),
+        cfg.get("price_weekend", globalParams["price_wkd_base"]),
+        royalty_rate + globalParams["other_operating_rate_base"],
+        _renovation_cost(strategy, globalParams),
+    )
+
+
+def build_strat_config(strategy: str, globalParams: dict, params: dict) -> StratConfig:
+    """
+    Resolves params[strategy] (with globalParams fallbacks) into a StratConfig,
+    so the hot path reads attributes instead of repeated dict lookups.
+    """
+    cfg = params[strategy]
+    price_std, price_wkd, r_total, renovation = _resolve_scalars(
+        strategy, globalParams, params)
+    return StratConfig(
+        price_std=price_std,
+        price_wkd=price_wkd,
+        r_total=r_total,
+        renovation=renovation,
+        mu_std=globalParams["stud_std_mean"] * cfg.get("demand_mult_std", 1.0),
+        mu_wkd=globalParams["stud_wkd_mean"] * cfg.get("demand_mult_wkd", 1.0),
+        sigma_std=globalParams["stud_std_std"],
+        sigma_wkd=globalParams["stud_wkd_std"],
+    )
+
+
+@dataclass
+class _PrecomputedEnv:
+    """
+    Quantities that only depend on globalParams (and the strategy config),
+    built once per run and shared by every strategy:
+      - discount_factors: array (T,)
+      - debt_sched: array (T,)
+      - configs: {strategy: StratConfig}
+    """
+    discount_factors: np.ndarray
+    debt_sched: np.ndarray
+    configs: dict
+
+    def config(self, strategy: str) -> StratConfig:
+        """Prebuilt StratConfig of strategy."""
+        try:
+            return self.configs[strategy]
+        except KeyError:
+            raise ValueError(
+                f"No StratConfig for strategy {strategy!r} in this environment"
+            ) from None
+
+
+def _build_env(globalParams: dict, params: dict, strategies: list) -> _PrecomputedEnv:
+    """
+    Precomputes discount factors, debt schedule and a StratConfig per
+    operating strategy (SELL is handled separately).
+    """
+    configs = {
+        s: build_strat_config(s, globalParams, params)
+        for s in strategies if s != "SELL"
+    }
+
+    return _PrecomputedEnv(
+        discount_factors=discount_factors(globalParams),
+        debt_sched=build_debt_schedule(globalParams),
+        configs=configs,
+    )
+
+
+def _as_float_array(x) -> np.ndarray:
+    """
+    Returns x as a floating-point array, without copying when it already
+    is one (float32 demand paths are kept as float32).
+    """
+    arr = np.asarray(x)
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(float)
+    return arr
+
+
 def compute_revenue(students_std, students_wkd, strategy: str,
                     globalParams: dict, params: dict):
     """
@@ -58,8 +296,8 @@ def compute_revenue(students_std, students_wkd, strategy: str,
     price_std = cfg.get("price_week",    globalParams["price_std_base"])
     price_wkd = cfg.get("price_weekend", globalParams["price_wkd_base"])
 
-    students_std = np.asarray(students_std, dtype=float)
-    students_wkd = np.asarray(students_wkd, dtype=float)
+    students_std = _as_float_array(students_std)
+    students_wkd = _as_float_array(students_wkd)
 
     revenue = price_std * students_std + price_wkd * students_wkd
     return revenue
@@ -73,62 +311,144 @@ def compute_operating_costs(revenue, strategy: str,
     cfg = params[strategy]
     royalty_rate = cfg.get("royalty_rate", globalParams["royalty_rate_base"])
     other_op_rate = globalParams["other_operating_rate_base"]
-    revenue = np.asarray(revenue, dtype=float)
+    revenue = _as_float_array(revenue)
     op_cost = (royalty_rate + other_op_rate) * revenue
     return op_cost
 
 
 def compute_cashflows_for_strategy(students_std, students_wkd, strategy: str,
-                                   globalParams: dict, params: dict):
+                                   globalParams: dict, params: dict,
+                                   debt_sched=None):
     """
     Returns cashflows (N_sim, T) for RELE or OILTS.
     For SELL it is not used (handled separately).
 
     Note: if strategy is OILTS, we apply a one-off renovation cost
     in the first year (t = 1).
+    debt_sched: optional precomputed debt schedule (T,).
     """
-    T = globalParams["T"]
-    revenue = compute_revenue(students_std, students_wkd, strategy, globalParams, params)
+    if debt_sched is None:
+        debt_sched = build_debt_schedule(globalParams)  # (T,)
+    revenue = compute_revenue(students_std, students_wkd, strategy,
+                              globalParams, params)
     op_cost = compute_operating_costs(revenue, strategy, globalParams, params)
-    debt_sched = build_debt_schedule(globalParams)  # (T,)
 
     total_cost = op_cost + debt_sched  # broadcasting
     cf = revenue - total_cost
 
-    # Additional renovation cost ONLY for OILTS
-    if strategy == "OILTS":
-        renovation = globalParams.get("OILTS_renovation_cost", 0.0)
+    # Additional renovation cost ONLY for OILTS (renovation is 0 otherwise)
+    renovation = _renovation_cost(strategy, globalParams)
+    if renovation:
         cf[..., 0] -= renovation  # apply in year 1
 
     return cf
 
 
-def discount_cashflows(cashflows, globalParams: dict):
+def discount_cashflows(cashflows, globalParams: dict, factors=None):
     """
     Discount cashflows and return NPV.
     cashflows:
       - shape (T,)     -> scalar
       - shape (N_sim,T)-> array (N_sim,)
+    factors: optional precomputed discount factors (T,).
     """
     cf = np.asarray(cashflows, dtype=float)
-    k = globalParams["K"]
+    if cf.ndim not in (1, 2):
+        raise ValueError("cashflows must be 1D or 2D")
 
+    if factors is None:
+        factors = _discount_factors_cached(cf.shape[-1], globalParams["K"])
+
+    # einsum reduces in one pass without a (N_sim, T) temporary (and, for
+    # small T, without the BLAS dispatch overhead of cf @ factors)
     if cf.ndim == 1:
-        T = cf.shape[0]
-        factors = 1.0 / (1.0 + k) ** np.arange(1, T + 1)
-        return float((cf * factors).sum())
-    elif cf.ndim == 2:
-        N_sim, T = cf.shape
-        factors = 1.0 / (1.0 + k) ** np.arange(1, T + 1)
-        return (cf * factors).sum(axis=1)
+        return float(np.einsum("t,t->", cf, factors))
     else:
-        raise ValueError("cashflows must be 1D or 2D")
+        return np.einsum("nt,t->n", cf, factors)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _npv_kernel(S_std, S_wkd, p_std, p_wkd, r_total, debt, factors, renovation):
+        """
+        Compiled NPV per simulation: one pass over (N_sim, T), parallel over
+        simulations, accumulating in float64.
+        """
+        N, T = S_std.shape
+        margin = 1.0 - r_total
+        out = np.empty(N, dtype=np.float64)
+        for i in prange(N):
+            acc = -renovation * factors[0]
+            for t in range(T):
+                acc += factors[t] * (margin * (p_std * S_std[i, t] + p_wkd * S_wkd[i, t])
+                                     - debt[t])
+            out[i] = acc
+        return out
+else:
+    _npv_kernel = None
+
+
+def _compute_npv(S_std, S_wkd, p_std, p_wkd, r_total, renovation, debt, factors):
+    """
+    Array-only part of npv_for_strategy_fused, on already resolved scalars.
+    Uses the compiled _npv_kernel when Numba is available; otherwise two
+    matrix-vector products stream the demand arrays once.
+    """
+    if _npv_kernel is not None and S_std.ndim == 2:
+        return _npv_kernel(S_std, S_wkd, float(p_std), float(p_wkd),
+                           float(r_total), debt, factors, float(renovation))
+
+    # float64 coefficients make the GEMVs accumulate in float64 (like
+    # _npv_kernel); only a chunk of float32 demand is upcast at a time
+    margin = 1.0 - r_total
+    coeff_std = (margin * p_std) * factors
+    coeff_wkd = (margin * p_wkd) * factors
+    const = (debt * factors).sum() + renovation * factors[0]
+
+    npv = S_std @ coeff_std
+    npv += S_wkd @ coeff_wkd
+    npv -= const
+    return npv
+
+
+def npv_for_strategy_fused(students_std, students_wkd, strategy: str,
+                           globalParams: dict, params: dict,
+                           env: _PrecomputedEnv = None):
+    """
+    Economic NPV (N_sim,) in a single reduction, equivalent to
+    compute_cashflows_for_strategy + discount_cashflows:
+
+      NPV = sum_t f_t * ((1 - r_total) * (p_std * S_std + p_wkd * S_wkd) - debt_t)
+            - renovation * f_1
+
+    Neither the Numba nor the NumPy path (see _compute_npv) materializes
+    revenue / cost / cashflow arrays (N_sim, T).
+    env: optional precomputed environment (see _build_env).
+    """
+    if env is None:
+        env = _build_env(globalParams, params, [strategy])
+    cfg = env.config(strategy)
+    return _compute_npv(np.asarray(students_std), np.asarray(students_wkd),
+                        cfg.price_std, cfg.price_wkd, cfg.r_total, cfg.renovation,
+                        env.debt_sched, env.discount_factors)
+
+
+def sell_npv_econ(globalParams: dict, params: dict) -> float:
+    """
+    Deterministic economic NPV of SELL: house value minus remaining debt.
+    """
+    house_val = params["SELL"]["house_expected_value"]
+    total_debt = globalParams["Debt_Payment"] * globalParams["Debt_Years"]
+    return house_val - total_debt
 
 
-def npv_for_strategy(strategy: str, globalParams: dict, params: dict, rng=None):
+def npv_for_strategy(strategy: str, globalParams: dict, params: dict, rng=None,
+                     env: _PrecomputedEnv = None):
     """
     - For RELE and OILTS: simulates demand, computes CF and returns NPV (array N_sim,).
+      Simulations are streamed in chunks of MC_CHUNK_SIZE paths.
     - For SELL: returns a constant NPV economic array.
+    env: optional precomputed environment (see _build_env).
     """
     if rng is None:
         rng = np.random.default_rng()
@@ -136,15 +456,30 @@ def npv_for_strategy(strategy: str, globalParams: dict, params: dict, rng=None):
     N = globalParams["N_Sim"]
 
     if strategy == "SELL":
-        house_val = params["SELL"]["house_expected_value"]
-        total_debt = globalParams["Debt_Payment"] * globalParams["Debt_Years"]
-        npv_econ_sell = house_val - total_debt
-        return np.full(N, npv_econ_sell, dtype=float)
+        return np.full(N, sell_npv_econ(globalParams, params), dtype=float)
 
     # Operating strategies: RELE / OILTS
-    students_std, students_wkd = sample_demand(strategy, globalParams, params, rng)
-    cf = compute_cashflows_for_strategy(students_std, students_wkd, strategy, globalParams, params)
-    npv_econ = discount_cashflows(cf, globalParams)
+    if env is None:
+        env = _build_env(globalParams, params, [strategy])
+    cfg = env.config(strategy)
+
+    # One independent child stream per chunk (SeedSequence spawning), so a
+    # chunk's draws do not depend on how many chunks precede it. A QMC
+    # engine, if any, is one sequence consumed chunk after chunk.
+    starts = range(0, N, MC_CHUNK_SIZE)
+    chunk_rngs = rng.spawn(len(starts))
+    qmc_engine = make_qmc_engine(globalParams, rng)
+
+    npv_econ = np.empty(N, dtype=float)
+    for start, chunk_rng in zip(starts, chunk_rngs):
+        n = min(MC_CHUNK_SIZE, N - start)
+        students_std, students_wkd = sample_demand(strategy, globalParams, params,
+                                                   chunk_rng, n_sim=n,
+                                                   qmc_engine=qmc_engine, cfg=cfg)
+        npv_econ[start:start + n] = npv_for_strategy_fused(
+            students_std, students_wkd, strategy, globalParams, params, env)
+        release_buffer(students_std)
+        release_buffer(students_wkd)
     return npv_econ
 
 
@@ -152,6 +487,60 @@ def npv_for_strategy(strategy: str, globalParams: dict, params: dict, rng=None):
 # 5. Intangibles and NEV
 # ===============================
 
+def _clip_score(x: float) -> float:
+    return min(max(x, 0.0), 10.0)
+
+
+def _intangible_scores(admin, rep, brand_b, prest_b,
+                       w_admin_moral, beta_prest_rep, beta_brand_rep):
+    """
+    Pure scalar part of get_intangible_scores. Returns (M, R, A).
+    """
+    prestige = _clip_score(prest_b + beta_prest_rep * rep)
+    moral    = _clip_score(w_admin_moral * admin + (1.0 - w_admin_moral) * prestige)
+    academic = _clip_score(brand_b + beta_brand_rep * rep)
+    return float(moral), float(rep), float(academic)
+
+
+@functools.lru_cache(maxsize=None)
+def _intangibles_cached(admin, rep, brand_b, prest_b,
+                        w_admin_moral, beta_prest_rep, beta_brand_rep,
+                        alpha_M, alpha_R, alpha_A):
+    """
+    Pure scalar part of intangible_values_eur, memoized on its inputs.
+    Returns (M, R, A, V_M, V_R, V_A).
+    """
+    M, R, A = _intangible_scores(admin, rep, brand_b, prest_b,
+                                 w_admin_moral, beta_prest_rep, beta_brand_rep)
+    return M, R, A, alpha_M * (M / 10.0), alpha_R * (R / 10.0), alpha_A * (A / 10.0)
+
+
+def _intangible_inputs(strategy: str, params: dict) -> tuple:
+    """
+    Scalar inputs of the intangible graph for a strategy.
+    """
+    cfg = params[strategy]
+    return (
+        cfg["admin_score"],
+        cfg["reputation_score"],
+        cfg["brand_base_score"],
+        cfg["prestige_score"],
+        cfg.get("w_admin_moral", 0.6),
+        cfg.get("beta_prestige_rep", 0.4),
+        cfg.get("beta_brand_rep", 0.5),
+    )
+
+
+def _intangibles(strategy: str, params: dict, globalParams: dict) -> tuple:
+    """
+    (M, R, A, V_M, V_R, V_A) for a strategy, through the memoized helper.
+    """
+    return _intangibles_cached(
+        *_intangible_inputs(strategy, params),
+        globalParams["alpha_M"], globalParams["alpha_R"], globalParams["alpha_A"],
+    )
+
+
 def get_intangible_scores(strategy: str, params: dict):
     """
     Returns intangible scores (0–10) for:
@@ -159,21 +548,8 @@ def get_intangible_scores(strategy: str, params: dict):
       - Reputation (R)
       - Academic / Brand (A)
     """
-    cfg = params[strategy]
-    admin   = cfg["admin_score"]
-    rep     = cfg["reputation_score"]
-    brand_b = cfg["brand_base_score"]
-    prest_b = cfg["prestige_score"]
-
-    w_admin_moral  = cfg.get("w_admin_moral", 0.6)
-    beta_prest_rep = cfg.get("beta_prestige_rep", 0.4)
-    beta_brand_rep = cfg.get("beta_brand_rep", 0.5)
-
-    prestige = np.clip(prest_b + beta_prest_rep * rep, 0.0, 10.0)
-    moral    = np.clip(w_admin_moral * admin + (1.0 - w_admin_moral) * prestige, 0.0, 10.0)
-    academic = np.clip(brand_b + beta_brand_rep * rep, 0.0, 10.0)
-
-    return {"M": float(moral), "R": float(rep), "A": float(academic)}
+    M, R, A = _intangible_scores(*_intangible_inputs(strategy, params))
+    return {"M": M, "R": R, "A": A}
 
 
 def intangible_values_eur(strategy: str, params: dict, globalParams: dict):
@@ -181,19 +557,9 @@ def intangible_values_eur(strategy: str, params: dict, globalParams: dict):
     Converts intangible scores into € amounts using:
       alpha_M, alpha_R, alpha_A.
     """
-    scores = get_intangible_scores(strategy, params)
-    M, R, A = scores["M"], scores["R"], scores["A"]
-
+    M, R, A, V_M, V_R, V_A = _intangibles(strategy, params, globalParams)
     M_n, R_n, A_n = M / 10.0, R / 10.0, A / 10.0
 
-    alpha_M = globalParams["alpha_M"]
-    alpha_R = globalParams["alpha_R"]
-    alpha_A = globalParams["alpha_A"]
-
-    V_M = alpha_M * M_n
-    V_R = alpha_R * R_n
-    V_A = alpha_A * A_n
-
     return {
         "M": M, "R": R, "A": A,
         "M_n": M_n, "R_n": R_n, "A_n": A_n,
@@ -206,8 +572,8 @@ def compute_nev(npv_econ, strategy: str, params: dict, globalParams: dict):
     NEV = economic NPV + intangible € values (M + R + A).
     """
     npv_econ = np.asarray(npv_econ, dtype=float)
-    iv = intangible_values_eur(strategy, params, globalParams)
-    NEV = npv_econ + iv["V_M"] + iv["V_R"] + iv["V_A"]
+    _, _, _, V_M, V_R, V_A = _intangibles(strategy, params, globalParams)
+    NEV = npv_econ + V_M + V_R + V_A
     return NEV
 
 
@@ -224,22 +590,23 @@ def analyze_status_quo(globalParams: dict, params: dict, strategy: str = "RELE",
     mean_std = globalParams["stud_std_mean"]
     mean_wkd = globalParams["stud_wkd_mean"]
 
-    students_std = np.full((1, T), mean_std, dtype=float)
-    students_wkd = np.full((1, T), mean_wkd, dtype=float)
+    # Constant demand -> constant revenue and operating cost each year, so
+    # the NPV has a closed form and the MC engine is not needed:
+    #   NPV = (1 - r_total) * revenue * sum_t f_t - sum_t debt_t * f_t
+    cfg = build_strat_config(strategy, globalParams, params)
+    revenue = cfg.price_std * mean_std + cfg.price_wkd * mean_wkd   # scalar
+    op_cost = cfg.r_total * revenue                                 # scalar
+    debt_sched = build_debt_schedule(globalParams)                      # (T,)
+    factors = discount_factors(globalParams)                            # (T,)
 
-    # Economic engine
-    revenue = compute_revenue(students_std, students_wkd,
-                              strategy, globalParams, params)   # (1, T)
-    op_cost = compute_operating_costs(revenue, strategy, globalParams, params)  # (1, T)
-    debt_sched = build_debt_schedule(globalParams)                              # (T,)
-
-    total_cost = op_cost + debt_sched  # (1, T)
-    cf = revenue - total_cost          # (1, T)
+    total_cost = op_cost + debt_sched  # (T,)
+    cf = revenue - total_cost          # (T,)
 
     # Deterministic economic NPV
-    npv_econ = discount_cashflows(cf, globalParams)[0]
+    npv_econ = (revenue - op_cost) * factors.sum() - debt_sched @ factors
     # Deterministic NEV (adding intangibles)
-    nev = compute_nev(npv_econ, strategy, params, globalParams)
+    _, _, _, V_M, V_R, V_A = _intangibles(strategy, params, globalParams)
+    nev = npv_econ + V_M + V_R + V_A
 
     print(f"=== Deterministic status quo for {strategy} ===")
     print(f"Average standard demand : {mean_std:.1f} student-weeks/year")
@@ -247,15 +614,13 @@ def analyze_status_quo(globalParams: dict, params: dict, strategy: str = "RELE",
     print(f"Deterministic economic NPV : {npv_econ:,.0f} €")
     print(f"Deterministic total NEV    : {nev:,.0f} €")
 
-    if plot:
-        rev = revenue[0]
-        tot_cost = total_cost[0]
-        cf_line = cf[0]
+    revenue_line = np.full(T, revenue)
 
+    if plot:
         plt.figure()
-        plt.plot(years, rev, marker="o", label="Revenues")
-        plt.plot(years, tot_cost, marker="o", label="Total costs (operating + debt)")
-        plt.plot(years, cf_line, marker="o", label="Cashflow")
+        plt.plot(years, revenue_line, marker="o", label="Revenues")
+        plt.plot(years, total_cost, marker="o", label="Total costs (operating + debt)")
+        plt.plot(years, cf, marker="o", label="Cashflow")
         plt.axhline(0, color="black", linewidth=0.8)
         plt.title(f"Deterministic status quo – strategy {strategy}")
         plt.xlabel("Year")
@@ -267,9 +632,9 @@ def analyze_status_quo(globalParams: dict, params: dict, strategy: str = "RELE",
     return {
         "npv_econ": npv_econ,
         "nev": float(nev),
-        "revenue": revenue[0],
-        "total_cost": total_cost[0],
-        "cashflow": cf[0],
+        "revenue": revenue_line,
+        "total_cost": total_cost,
+        "cashflow": cf,
     }
 
 
@@ -277,7 +642,8 @@ def analyze_status_quo(globalParams: dict, params: dict, strategy: str = "RELE",
 # 6. Simulation per strategy
 # ===============================
 
-def simulate_strategy(strategy: str, globalParams: dict, params: dict, rng=None):
+def simulate_strategy(strategy: str, globalParams: dict, params: dict, rng=None,
+                      env: _PrecomputedEnv = None):
     """
     Returns:
       - npv_econ: array (N_sim,)
@@ -285,34 +651,105 @@ def simulate_strategy(strategy: str, globalParams: dict, params: dict, rng=None)
     """
     if rng is None:
         rng = np.random.default_rng()
-    npv_econ = npv_for_strategy(strategy, globalParams, params, rng)
+    npv_econ = npv_for_strategy(strategy, globalParams, params, rng, env=env)
     nev = compute_nev(npv_econ, strategy, params, globalParams)
     return {"npv_econ": npv_econ, "nev": nev}
 
 
-def run_all_strategies(globalParams: dict, params: dict, strategies: list):
+def var_cvar(x, q: float = 0.05):
+    """
+    Returns (VaR_q, CVaR_q) of a 1D sample using np.partition (O(N), no sort):
+      - VaR_q  = np.percentile(x, 100 * q) (linear interpolation)
+      - CVaR_q = mean of x[x <= VaR_q]
+    """
+    x = np.asarray(x, dtype=float)
+    N = x.shape[0]
+    pos = q * (N - 1)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, N - 1)
+    part = np.partition(x, (lo, hi))
+
+    # same interpolation as np.percentile(method="linear")
+    a, b, t = part[lo], part[hi], pos - lo
+    VaR = b - (b - a) * (1.0 - t) if t >= 0.5 else a + (b - a) * t
+
+    tail = part[:hi + 1]
+    tail = tail[tail <= VaR]
+    total, count = tail.sum(), tail.size
+    if b == VaR:
+        # ties with VaR may also sit to the right of the partition point
+        n_ties = np.count_nonzero(part[hi + 1:] == VaR)
+        total += n_ties * VaR
+        count += n_ties
+    return VaR, total / count
+
+
+def run_all_strategies(globalParams: dict, params: dict, strategies: list,
+                       processes: int = 1, pool=None):
     """
     Runs the Monte Carlo for each strategy and returns:
-      - results: dict with full distributions
+      - results: dict with full distributions, in the order of strategies
       - summary: list of dicts with EU, VaR5, CVaR5, P(NEV > SELL)
+
+    Strategies run in the current process by default. They can instead be
+    spread over worker processes: pass a multiprocessing pool to reuse
+    across calls (recommended for scenario grids), or processes > 1 to
+    start a "spawn" pool for this call only (scripts must then use an
+    `if __name__ == "__main__":` guard). With Numba, _npv_kernel already
+    runs in parallel over all cores, so worker processes mostly add
+    startup cost and oversubscription; they are still used when asked for.
+    Each strategy gets its own child seed of SeedSequence(123), further
+    spawned per chunk in npv_for_strategy, so results do not depend on the
+    number of processes or on the order in which chunks are processed.
+
+    SELL is deterministic: its NEV is a single scalar and its summary
+    statistics are that scalar. results["SELL"]["npv_econ"] and ["nev"]
+    are read-only np.broadcast_to views (shape (N_sim,), stride 0, no
+    N_sim allocation); callers that need to modify them must .copy() first.
     """
-    rng = np.random.default_rng(123)
-    results = {}
-    for s in strategies:
-        results[s] = simulate_strategy(s, globalParams, params, rng)
+    N = globalParams["N_Sim"]
+    op_strategies = [s for s in strategies if s != "SELL"]
+    seeds = np.random.SeedSequence(123).spawn(len(strategies))
+    env = _build_env(globalParams, params, strategies)
+    tasks = [
+        (s, globalParams, params, np.random.Generator(np.random.PCG64(seed)), env)
+        for s, seed in zip(strategies, seeds) if s != "SELL"
+    ]
+
+    if pool is not None:
+        outs = pool.starmap(simulate_strategy, tasks)
+    elif processes is not None and processes > 1:
+        with multiprocessing.get_context("spawn").Pool(processes) as new_pool:
+            outs = new_pool.starmap(simulate_strategy, tasks)
+    else:
+        outs = [simulate_strategy(*task) for task in tasks]
+    op_results = dict(zip(op_strategies, outs))
+
+    sell_nev = None
+    if "SELL" in strategies:
+        sell_npv = sell_npv_econ(globalParams, params)
+        _, _, _, V_M, V_R, V_A = _intangibles("SELL", params, globalParams)
+        sell_nev = sell_npv + V_M + V_R + V_A
+        op_results["SELL"] = {
+            "npv_econ": np.broadcast_to(np.float64(sell_npv), (N,)),
+            "nev": np.broadcast_to(np.float64(sell_nev), (N,)),
+        }
+    results = {s: op_results[s] for s in strategies}
 
     # Summary per strategy
     summary = []
-    sell_nev = results["SELL"]["nev"]
     for s in strategies:
-        NEV = results[s]["nev"]
-        EU = NEV.mean()
-        VaR5 = np.percentile(NEV, 5)
-        CVaR5 = NEV[NEV <= VaR5].mean()
         if s == "SELL":
+            EU = VaR5 = CVaR5 = np.float64(sell_nev)
             P_better_than_sell = np.nan
         else:
-            P_better_than_sell = (NEV > sell_nev).mean()
+            NEV = results[s]["nev"]
+            EU = NEV.mean()
+            VaR5, CVaR5 = var_cvar(NEV, 0.05)
+            if sell_nev is None:
+                P_better_than_sell = np.nan
+            else:
+                P_better_than_sell = np.count_nonzero(NEV > sell_nev) / NEV.size
         summary.append({
             "strategy": s,
             "EU": EU,
@@ -1,5 +1,3 @@
-import copy
-
 # ===============================
 # 0) Global parameters (base)
 # ===============================
@@ -14,6 +12,8 @@ globalParams = {
     "Debt_Payment": 50000,   # annual debt service
     "Debt_Years": 5,         # years with debt
     "OILTS_renovation_cost": 200000.0,  # one-off renovation cost for OILTS
+    "demand_dist": "clipped",  # "clipped" or "truncated" normal demand
+    "sampler": "pseudo",       # "pseudo" (MC) or "sobol" (quasi-MC)
 }
 
 strategies = ["RELE", "OILTS", "SELL"]
@@ -236,11 +236,14 @@ scenario_defs = [
 
 def apply_scenario(base_globalParams, base_params, scenario_def):
     """
-    Returns (scenario_globalParams, scenario_params) as deep copies of the base,
+    Returns (scenario_globalParams, scenario_params) as copies of the base,
     with scenario-specific overrides applied.
+
+    Parameter values are immutable scalars, so copying the two dict levels
+    (globals, and params per strategy) is enough; no deepcopy needed.
     """
-    gp = copy.deepcopy(base_globalParams)
-    ps = copy.deepcopy(base_params)
+    gp = {**base_globalParams}
+    ps = {strat: {**cfg} for strat, cfg in base_params.items()}
 
     # 1) Global updates
     gupd = scenario_def.get("global", {})